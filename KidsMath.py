@@ -168,7 +168,7 @@ class TestWidget(QWidget):
         self.total_try += 1
         msg = self.tr('Last: %s = %s Rate: %s' % (
             last_formula, answer, self.correct_rate()))
-        self.status_bar.showMessage(self.convert_operator(msg))
+        self.status_bar.showMessage(formula.convert_operator(msg))
         if self.index == self.total_tests:
             self.show_summary()
             self.stop_test()
@@ -189,8 +189,8 @@ class TestWidget(QWidget):
         self.total_tests = total_tests
         # skip filename check in test mode
         filename = True
-        err_msg = self.options.check_input(filename,
-                                           upper_limit, lower_limit, operators)
+        err_msg = self.options.check_input(filename, upper_limit,
+                                           lower_limit, n_number, operators)
         if err_msg:
             self.options.err_dialog(err_msg)
         else:
@@ -204,13 +204,9 @@ class TestWidget(QWidget):
             self.next.setDefault(True)
 
     def set_test(self, index):
-        text = self.convert_operator(self.tests[index])
+        text = formula.convert_operator(self.tests[index])
         self.formula.setText(text)
 
-    def convert_operator(self, formula):
-        text = re.sub(r'\*', '×', formula)
-        return re.sub(r'\/', '÷', text)
-
     def toggle_enable(self, w):
         if w.isEnabled():
             w.setEnabled(False)
@@ -318,8 +314,8 @@ class SaveWidget(QWidget):
     def save_file(self):
         (filename, upper_limit, lower_limit,
          n_number, total_tests, operators) = self.collect_input()
-        err_msg = self.check_input(filename,
-                                   upper_limit, lower_limit, operators)
+        err_msg = self.check_input(filename, upper_limit,
+                                   lower_limit, n_number, operators)
         if err_msg:
             self.err_dialog(err_msg)
         else:
@@ -330,15 +326,14 @@ class SaveWidget(QWidget):
             msg = '%s generated!\n' % filename
             self.info_dialog(msg)
 
-    def check_input(self, filename, upper_limit, lower_limit, operators):
+    def check_input(self, filename, upper_limit, lower_limit,
+                    n_number, operators):
         err_msg = ''
         if not filename:
             err_msg += self.tr('missing file name\n')
-        if upper_limit < lower_limit:
-            err_msg += self.tr(
-                'wrong setting, min number is larger than max number\n')
-        if len(operators) == 0:
-            err_msg += self.tr('at least one operator must be checked\n')
+        for msg in formula.check_config(operators, upper_limit,
+                                        lower_limit, n_number):
+            err_msg += self.tr(msg)
         return err_msg
 
     def collect_input(self):
@@ -61,8 +61,7 @@ def gen_xlsx(filename, tests, results, n_numbers, split_num):
     formula_columns = list(range(1, max_columns + 1, n_col_every_formula))
 
     for i, test in enumerate(tests):
-        test = re.sub(r'\*', '×', test)
-        test = re.sub(r'\/', '÷', test)
+        test = convert_operator(test)
         row.extend([test, '=', '', results[i], ''])
         if (i + 1) % split_num == 0:
             data.append(row)
@@ -81,6 +80,11 @@ def gen_xlsx(filename, tests, results, n_numbers, split_num):
     wb.save(filename=filename)
 
 
+def convert_operator(formula):
+    text = re.sub(r'\*', '×', formula)
+    return re.sub(r'\/', '÷', text)
+
+
 def adjust_column_width(ws, formula_columns, split_num):
     equal_sign_columns = [i + 1 for i in formula_columns]
     hide_columns = [i + 3 for i in formula_columns]
@@ -113,26 +117,6 @@ def calculate_width(cells):
     return max(len(str(cell.value)) for cell in cells) + 2
 
 
-def gen_test(operators, upper_limit, lower_limit, n_numbers, n_tests):
-    func_of_operator = {
-        '+': numbers_for_plus,
-        '-': numbers_for_minus,
-        '*': numbers_for_multiple,
-        '/': numbers_for_divide,
-    }
-    all_tests = []
-    all_results = []
-    i = 0
-    while i < n_tests:
-        numbers, generated_operators, result = gen_random(
-            operators, func_of_operator, upper_limit, lower_limit, n_numbers
-        )
-        all_tests.append(gen_formula(numbers, generated_operators))
-        all_results.append(result)
-        i += 1
-    return all_tests, all_results
-
-
 def gen_formula(numbers, operators):
     if len(operators) == 1:
         operator = ' %s ' % operators[0]
@@ -212,8 +196,8 @@ def numbers_for_minus(target, lower_limit, upper_limit):
 
 
 def numbers_for_multiple(target, lower_limit, upper_limit):
-    n1 = int(random.choice(divisors(target)))
-    n2 = int(target / n1)
+    n1 = random.choice(factors(target))
+    n2 = target // n1
     return n1, n2
 
 
@@ -235,6 +219,87 @@ def divisors(n):
     return list(set(divs))
 
 
+# factor table shared by all generators, precomputed once up to the
+# largest max number the GUI allows; bigger targets are factored on
+# every call since they rarely repeat within a large range
+FACTOR_TABLE_LIMIT = 1000
+FACTOR_TABLE = tuple(tuple(sorted(int(d) for d in divisors(i)))
+                     for i in range(FACTOR_TABLE_LIMIT + 1))
+
+
+def factors(n):
+    if n <= FACTOR_TABLE_LIMIT:
+        return FACTOR_TABLE[n]
+    return tuple(sorted(int(d) for d in divisors(n)))
+
+
+FUNC_OF_OPERATOR = {
+    '+': numbers_for_plus,
+    '-': numbers_for_minus,
+    '*': numbers_for_multiple,
+    '/': numbers_for_divide,
+}
+
+
+class ProblemGenerator(object):
+    # configuration is validated and prepared once and never mutated
+    # afterwards, so a single instance can be shared between threads
+
+    def __init__(self, operators, upper_limit, lower_limit, n_numbers):
+        messages = check_config(operators,
+                                upper_limit, lower_limit, n_numbers)
+        if messages:
+            raise ValueError(''.join(messages))
+        self.operators = tuple(operators)
+        self.upper_limit = upper_limit
+        self.lower_limit = lower_limit
+        self.n_numbers = n_numbers
+
+    def generate(self):
+        numbers, generated_operators, result = gen_random(
+            self.operators, FUNC_OF_OPERATOR,
+            self.upper_limit, self.lower_limit, self.n_numbers
+        )
+        return gen_formula(numbers, generated_operators), result
+
+    def batch(self, n_tests):
+        all_tests = []
+        all_results = []
+        for _ in range(n_tests):
+            test, result = self.generate()
+            all_tests.append(test)
+            all_results.append(result)
+        return all_tests, all_results
+
+    def iter(self):
+        while True:
+            yield self.generate()
+
+
+def check_config(operators, upper_limit, lower_limit, n_numbers):
+    # messages are untranslated, KidsMath.py passes them through tr
+    messages = []
+    if lower_limit < 0:
+        messages.append('wrong setting, min number must not be negative\n')
+    if upper_limit < lower_limit:
+        messages.append(
+            'wrong setting, min number is larger than max number\n')
+    if len(operators) == 0:
+        messages.append('at least one operator must be checked\n')
+    unknown = [o for o in operators if o not in FUNC_OF_OPERATOR]
+    if unknown:
+        messages.append('unsupported operator %s\n' % ', '.join(unknown))
+    if n_numbers < 2:
+        messages.append('at least two numbers per formula\n')
+    return messages
+
+
+def gen_test(operators, upper_limit, lower_limit, n_numbers, n_tests):
+    generator = ProblemGenerator(operators,
+                                 upper_limit, lower_limit, n_numbers)
+    return generator.batch(n_tests)
+
+
 def eval_expr(expr):
     return eval_(ast.parse(expr, mode='eval').body)
 
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+
+import argparse
+import csv
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from zipfile import BadZipFile
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+
+N_COL_EVERY_FORMULA = 5  # [formula, =, answer, result, '']
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Grade completed kids math worksheets')
+    parser.add_argument('directory', help='directory of completed .xlsx')
+    parser.add_argument('--students', '-s', dest='students',
+                        default='students.csv',
+                        help='per-student accuracy csv')
+    parser.add_argument('--facts', '-f', dest='facts',
+                        default='facts.csv', help='per-fact accuracy csv')
+    parser.add_argument('--workers', '-w', dest='workers', type=int,
+                        default=None, help='number of worker processes')
+    args = parser.parse_args()
+    files = find_worksheets(args.directory)
+    graded = []
+    for student, answers in grade_files(files, args.workers):
+        if not answers:
+            print('%s skipped, not a readable worksheet' % student)
+        else:
+            graded.append((student, answers))
+    write_student_csv(args.students, graded)
+    write_fact_csv(args.facts, graded)
+    print('%d worksheets graded!\n' % len(graded))
+    return None
+
+
+def find_worksheets(directory):
+    # skip lock files left behind by excel while a sheet is open
+    return sorted(str(p) for p in Path(directory).glob('*.xlsx')
+                  if not p.name.startswith('~$'))
+
+
+def grade_files(files, workers=None):
+    if not files:
+        return []
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(grade_file, files, chunksize=chunksize))
+
+
+def grade_file(filename):
+    # answers is None for files that can not be read, so one corrupt or
+    # half synced workbook does not abort grading the whole directory.
+    # SyntaxError covers both xml.etree's ParseError and lxml's
+    # XMLSyntaxError, whichever backend openpyxl picked
+    try:
+        wb = load_workbook(filename, read_only=True, data_only=True)
+    except (BadZipFile, InvalidFileException, KeyError, OSError,
+            SyntaxError, ValueError):
+        return Path(filename).stem, None
+    try:
+        answers = list(read_answers(wb.active))
+    except (BadZipFile, KeyError, AttributeError, SyntaxError, ValueError):
+        answers = None
+    finally:
+        wb.close()
+    return Path(filename).stem, answers
+
+
+def read_answers(ws):
+    # only cells laid out by gen_xlsx count, anything else in the
+    # directory (rosters, notes) yields no answers
+    for row in ws.iter_rows(values_only=True):
+        for j in range(0, len(row), N_COL_EVERY_FORMULA):
+            test = row[j]
+            if not isinstance(test, str) or safe_get(row, j + 1) != '=':
+                continue
+            answer = safe_get(row, j + 2)
+            result = safe_get(row, j + 3)
+            yield test, is_correct(answer, result)
+
+
+def safe_get(row, idx, default=None):
+    if idx < len(row):
+        return row[idx]
+    return default
+
+
+def is_correct(answer, result):
+    if answer in (None, '') or result in (None, ''):
+        return False
+    try:
+        return float(answer) == float(result)
+    except (TypeError, ValueError):
+        return False
+
+
+def write_student_csv(filename, graded):
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['student', 'total', 'correct', 'rate'])
+        for student, answers in graded:
+            correct = sum(1 for _, ok in answers if ok)
+            writer.writerow([student, len(answers), correct,
+                             rate(correct, len(answers))])
+
+
+def write_fact_csv(filename, graded):
+    totals = defaultdict(int)
+    corrects = defaultdict(int)
+    for _, answers in graded:
+        for test, ok in answers:
+            totals[test] += 1
+            if ok:
+                corrects[test] += 1
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['fact', 'total', 'correct', 'rate'])
+        for test in sorted(totals):
+            writer.writerow([test, totals[test], corrects[test],
+                             rate(corrects[test], totals[test])])
+
+
+def rate(correct, total):
+    if total == 0:
+        return '0.00'
+    return '%.2f' % (correct / total)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+
+import argparse
+import functools
+import html
+import re
+from pathlib import Path
+from string import Template
+import formula
+
+
+ROWS_PER_PAGE = 18
+# A4 portrait in millimeters
+PAGE_WIDTH = 210
+PAGE_HEIGHT = 297
+MARGIN = 15
+ROW_HEIGHT = 14
+
+HTML_HEAD = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>
+@page { size: A4; margin: ${margin}mm; }
+body { font-family: sans-serif; margin: 0; }
+.page { page-break-after: always; }
+.page:last-child { page-break-after: auto; }
+table { border-collapse: collapse; width: 100%; }
+td { font-size: 16pt; height: ${row_height}mm; padding: 0 1mm; }
+td.formula, td.answer { border-bottom: thin solid; white-space: nowrap; }
+td.equal { width: 3ch; text-align: center; }
+</style>
+</head>
+<body>
+'''
+HTML_TAIL = '</body>\n</html>\n'
+HTML_PAGE = Template('<div class="page"><table>\n$rows</table></div>\n')
+HTML_ROW = Template('<tr>$cells</tr>\n')
+HTML_CELL = Template('<td class="formula">$test</td><td class="equal">=</td>'
+                     '<td class="answer" style="width: ${width}ch">'
+                     '$answer</td><td style="width: ${seperator}%"></td>')
+
+SVG_PAGE = Template(
+    '<?xml version="1.0" encoding="utf-8"?>\n'
+    '<svg xmlns="http://www.w3.org/2000/svg" width="${width}mm" '
+    'height="${height}mm" viewBox="0 0 $width $height" '
+    'font-family="sans-serif" font-size="6">\n$rows</svg>\n')
+SVG_CELL = Template(
+    '<text x="$x" y="$y">$test =</text>'
+    '<line x1="$line_x1" y1="$line_y" x2="$line_x2" y2="$line_y" '
+    'stroke="black" stroke-width="0.2"/>'
+    '<text x="$answer_x" y="$y">$answer</text>\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Render kids math tests as printable pages')
+    parser.add_argument('--format', '-f', dest='fmt', default='html',
+                        choices=('html', 'svg'), help='output format')
+    parser.add_argument('--key', '-k', dest='answer_key',
+                        action='store_true', help='also render answer key')
+    args = parser.parse_args()
+    lower_limit = 1
+    upper_limit = 20
+    operators = ['+', '-', '*', '/']
+    n_numbers = 2
+    n_tests = 100
+    filename = 'kidsmath.%s' % args.fmt
+    tests, results = formula.gen_test(operators,
+                                      upper_limit, lower_limit,
+                                      n_numbers, n_tests)
+    filenames = render(filename, tests, results, n_numbers, args.fmt)
+    if args.answer_key:
+        filename = 'kidsmath-key.%s' % args.fmt
+        filenames += render(filename, tests, results, n_numbers, args.fmt,
+                            answer_key=True)
+    for filename in filenames:
+        print('%s generated!\n' % filename)
+    return None
+
+
+def render(filename, tests, results, n_numbers, fmt='html',
+           answer_key=False, rows_per_page=ROWS_PER_PAGE):
+    split_num = formula.gen_split(n_numbers)
+    pages = iter_pages(tests, results, split_num, rows_per_page, answer_key)
+    if fmt == 'html':
+        return write_html(filename, pages, split_num)
+    elif fmt == 'svg':
+        return write_svg(filename, pages, split_num)
+    else:
+        raise ValueError('unsupported format %s' % fmt)
+
+
+def iter_pages(tests, results, split_num, rows_per_page, answer_key=False):
+    page = []
+    row = []
+    for i, test in enumerate(tests):
+        answer = results[i] if answer_key else ''
+        row.append((html.escape(formula.convert_operator(test)), answer))
+        if len(row) == split_num:
+            page.append(row)
+            row = []
+            if len(page) == rows_per_page:
+                yield page
+                page = []
+    if len(row):
+        page.append(row)
+    if len(page):
+        yield page
+
+
+def write_html(filename, pages, split_num):
+    page_template = html_page_template(split_num)
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(Template(HTML_HEAD).substitute(
+            title=html.escape(Path(filename).stem),
+            margin=MARGIN, row_height=ROW_HEIGHT))
+        for page in pages:
+            f.write(page_template(page))
+        f.write(HTML_TAIL)
+    return [filename]
+
+
+def write_svg(filename, pages, split_num):
+    # svg has no notion of pages, so every page becomes its own file
+    page_template = svg_page_template(split_num)
+    path = Path(filename)
+    remove_stale_pages(path)
+    filenames = []
+    for i, page in enumerate(pages):
+        page_name = path.with_name('%s-%03d%s' % (path.stem, i + 1,
+                                                   path.suffix))
+        with open(page_name, 'w', encoding='utf-8') as f:
+            f.write(page_template(page))
+        filenames.append(str(page_name))
+    return filenames
+
+
+def remove_stale_pages(path):
+    # a previous longer run may have left extra numbered pages behind,
+    # match the digits exactly so e.g. <stem>-key-001.svg survives
+    page_re = re.compile(r'%s-\d{3,}%s' % (re.escape(path.stem),
+                                          re.escape(path.suffix)))
+    for page_name in path.parent.iterdir():
+        if page_re.fullmatch(page_name.name):
+            page_name.unlink()
+
+
+@functools.lru_cache(maxsize=None)
+def html_page_template(split_num):
+    # widths only depend on the layout, bake them into the cell once
+    cell = Template(HTML_CELL.safe_substitute(
+        width=6, seperator='%.1f' % (21 / split_num)))
+
+    def render_page(page):
+        rows = ''.join(
+            HTML_ROW.substitute(cells=''.join(
+                cell.substitute(test=test, answer=answer)
+                for test, answer in row))
+            for row in page)
+        return HTML_PAGE.substitute(rows=rows)
+    return render_page
+
+
+@functools.lru_cache(maxsize=None)
+def svg_page_template(split_num):
+    column_width = (PAGE_WIDTH - 2 * MARGIN) / split_num
+    # precompute the per-column geometry, only y varies between rows
+    columns = []
+    for j in range(split_num):
+        x = MARGIN + j * column_width
+        columns.append(Template(SVG_CELL.safe_substitute(
+            x='%.1f' % x,
+            line_x1='%.1f' % (x + column_width * 0.55),
+            line_x2='%.1f' % (x + column_width * 0.9),
+            answer_x='%.1f' % (x + column_width * 0.6))))
+    page = Template(SVG_PAGE.safe_substitute(width=PAGE_WIDTH,
+                                             height=PAGE_HEIGHT))
+
+    def render_page(rows):
+        text = []
+        for i, row in enumerate(rows):
+            y = MARGIN + (i + 1) * ROW_HEIGHT
+            for j, (test, answer) in enumerate(row):
+                text.append(columns[j].substitute(
+                    test=test, answer=answer,
+                    y=y, line_y='%.1f' % (y + 1)))
+        return page.substitute(rows=''.join(text))
+    return render_page
+
+
+if __name__ == '__main__':
+    main()
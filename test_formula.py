@@ -0,0 +1,41 @@
+import random
+import pytest
+import formula
+
+
+@pytest.mark.parametrize('operators', [
+    ['+'], ['-'], ['/'], ['+', '-'], ['-', '/'], ['+', '/'],
+    ['+', '-', '*', '/'],
+])
+@pytest.mark.parametrize('n_numbers', [2, 3, 4])
+def test_gen_test_results(operators, n_numbers):
+    for seed in range(200):
+        random.seed(seed)
+        tests, results = formula.gen_test(operators, 20, 1, n_numbers, 10)
+        for test, result in zip(tests, results):
+            assert formula.eval_expr(test) == result
+
+
+def test_generator_zero_lower_limit():
+    generator = formula.ProblemGenerator(['/'], 20, 0, 2)
+    for seed in range(200):
+        random.seed(seed)
+        tests, results = generator.batch(10)
+        for test, result in zip(tests, results):
+            assert formula.eval_expr(test) == result
+
+
+def test_generator_invalid_config():
+    with pytest.raises(ValueError):
+        formula.ProblemGenerator([], 20, 1, 2)
+    with pytest.raises(ValueError):
+        formula.ProblemGenerator(['+'], 1, 20, 2)
+
+
+def test_factors():
+    assert formula.factors(0) == (1,)
+    assert formula.factors(12) == (1, 2, 3, 4, 6, 12)
+    limit = formula.FACTOR_TABLE_LIMIT
+    for n in (limit, limit + 1, 2 * 3 * 5 * 7 * 11):
+        assert formula.factors(n) == tuple(
+            d for d in range(1, n + 1) if n % d == 0)
@@ -0,0 +1,114 @@
+import zipfile
+from openpyxl import Workbook, load_workbook
+import formula
+import grade
+
+
+def write_sheet(path, tests, results):
+    formula.gen_xlsx(str(path), tests, results, 2, formula.gen_split(2))
+    return str(path)
+
+
+def truncate_member(src, dst, member):
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst, 'w') as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == member:
+                data = data[:len(data) // 2]
+            zout.writestr(item, data)
+    return str(dst)
+
+
+def test_grade_file_half_synced_sheet(tmp_path):
+    src = write_sheet(tmp_path / 'src.xlsx', ['1 + 1'], [2])
+    for member in ('xl/worksheets/sheet1.xml', 'xl/workbook.xml'):
+        dst = truncate_member(src, tmp_path / 'cut.xlsx', member)
+        assert grade.grade_file(dst) == ('cut', None)
+
+
+def test_grade_file_not_a_zip(tmp_path):
+    junk = tmp_path / 'junk.xlsx'
+    junk.write_text('junk')
+    assert grade.grade_file(str(junk)) == ('junk', None)
+
+
+def test_grade_file_foreign_sheet(tmp_path):
+    wb = Workbook()
+    wb.active.append([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
+    wb.active.append(['name', 'class', '', '', '', 'notes'])
+    wb.save(str(tmp_path / 'roster.xlsx'))
+    graded = [grade.grade_file(str(tmp_path / 'roster.xlsx'))]
+    assert graded == [('roster', [])]
+    out = tmp_path / 'facts.csv'
+    grade.write_fact_csv(str(out), graded)
+    assert out.read_text().splitlines() == ['fact,total,correct,rate']
+
+
+def fill_answers(path, answers):
+    # answer cell is the third of every 5 columns gen_xlsx writes
+    wb = load_workbook(path)
+    ws = wb.active
+    split_num = formula.gen_split(2)
+    for i, answer in enumerate(answers):
+        row = i // split_num + 1
+        column = i % split_num * grade.N_COL_EVERY_FORMULA + 3
+        ws.cell(row=row, column=column).value = answer
+    wb.save(path)
+
+
+def test_is_correct():
+    assert grade.is_correct(4, 4)
+    assert grade.is_correct('4', 4)
+    assert grade.is_correct(4.0, 4)
+    assert not grade.is_correct(5, 4)
+    assert not grade.is_correct(None, 4)
+    assert not grade.is_correct('', 4)
+    assert not grade.is_correct('four', 4)
+
+
+def test_read_answers(tmp_path):
+    tests = ['1 + 1', '6 / 2', '2 * 3', '5 - 1']
+    path = write_sheet(tmp_path / 'amy.xlsx', tests, [2, 3, 6, 4])
+    fill_answers(path, [2, 4, 6])
+    wb = load_workbook(path, read_only=True)
+    answers = list(grade.read_answers(wb.active))
+    wb.close()
+    assert answers == [('1 + 1', True), ('6 ÷ 2', False),
+                       ('2 × 3', True), ('5 - 1', False)]
+
+
+def test_grade_and_write_csv(tmp_path):
+    sheets = tmp_path / 'sheets'
+    sheets.mkdir()
+    tests = ['1 + 1', '6 / 2']
+    fill_answers(write_sheet(sheets / 'amy.xlsx', tests, [2, 3]), [2, 3])
+    fill_answers(write_sheet(sheets / 'bob.xlsx', tests, [2, 3]), [2, 1])
+    (sheets / 'junk.xlsx').write_text('junk')
+    roster = Workbook()
+    roster.active.append([1, 2, 3, 4, 5])
+    roster.save(str(sheets / 'roster.xlsx'))
+
+    files = grade.find_worksheets(str(sheets))
+    graded = dict(grade.grade_files(files, 2))
+    assert graded == {
+        'amy': [('1 + 1', True), ('6 ÷ 2', True)],
+        'bob': [('1 + 1', True), ('6 ÷ 2', False)],
+        'junk': None,
+        'roster': [],
+    }
+
+    graded = [(k, v) for k, v in sorted(graded.items()) if v]
+    students = tmp_path / 'students.csv'
+    facts = tmp_path / 'facts.csv'
+    grade.write_student_csv(str(students), graded)
+    grade.write_fact_csv(str(facts), graded)
+    assert students.read_text(encoding='utf-8').splitlines() == [
+        'student,total,correct,rate',
+        'amy,2,2,1.00',
+        'bob,2,1,0.50',
+    ]
+    assert facts.read_text(encoding='utf-8').splitlines() == [
+        'fact,total,correct,rate',
+        '1 + 1,2,2,1.00',
+        '6 ÷ 2,2,1,0.50',
+    ]
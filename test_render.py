@@ -0,0 +1,68 @@
+import render
+
+
+def test_remove_stale_pages_glob_characters(tmp_path):
+    filename = str(tmp_path / 'a[1].svg')
+    tests = ['1 + 1'] * 12
+    results = [2] * 12
+    assert len(render.render(filename, tests, results, 2, 'svg',
+                             rows_per_page=2)) == 2
+    pages = render.render(filename, tests[:3], results[:3], 2, 'svg',
+                          rows_per_page=2)
+    assert pages == [str(tmp_path / 'a[1]-001.svg')]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['a[1]-001.svg']
+
+
+def test_iter_pages_full_page():
+    tests = ['%d + 1' % i for i in range(6)]
+    pages = list(render.iter_pages(tests, list(range(6)), 3, 2))
+    assert len(pages) == 1
+    assert [len(row) for row in pages[0]] == [3, 3]
+
+
+def test_iter_pages_partial_last_row():
+    tests = ['%d + 1' % i for i in range(8)]
+    pages = list(render.iter_pages(tests, list(range(8)), 3, 2))
+    assert [[len(row) for row in page] for page in pages] == [[3, 3], [2]]
+    assert pages[1][0] == [('6 + 1', ''), ('7 + 1', '')]
+
+
+def test_iter_pages_empty():
+    assert list(render.iter_pages([], [], 3, 2)) == []
+
+
+def test_iter_pages_converts_operators():
+    pages = list(render.iter_pages(['6 / 2', '2 * 3'], [3, 6], 3, 2, True))
+    assert pages == [[[('6 ÷ 2', 3), ('2 × 3', 6)]]]
+
+
+def test_remove_stale_pages(tmp_path):
+    filename = str(tmp_path / 'sheet.svg')
+    tests = ['1 + 1'] * 12
+    results = [2] * 12
+    render.render(filename, tests, results, 2, 'svg', rows_per_page=2)
+    render.render(str(tmp_path / 'sheet-key.svg'), tests, results, 2,
+                  'svg', answer_key=True, rows_per_page=2)
+    (tmp_path / 'sheet-note.svg').write_text('note')
+    render.render(filename, tests[:3], results[:3], 2, 'svg',
+                  rows_per_page=2)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        'sheet-001.svg', 'sheet-key-001.svg', 'sheet-key-002.svg',
+        'sheet-note.svg']
+
+
+def test_answer_key(tmp_path):
+    tests = ['17 + 25', '99 - 13']
+    results = [42, 86]
+    for fmt in ('html', 'svg'):
+        sheet = render.render(str(tmp_path / ('sheet.' + fmt)),
+                              tests, results, 2, fmt)
+        key = render.render(str(tmp_path / ('key.' + fmt)),
+                            tests, results, 2, fmt, answer_key=True)
+        sheet_text = ''.join(open(f, encoding='utf-8').read()
+                             for f in sheet)
+        key_text = ''.join(open(f, encoding='utf-8').read() for f in key)
+        for test, result in zip(tests, results):
+            assert test in sheet_text and test in key_text
+            assert '>%d<' % result in key_text
+            assert '>%d<' % result not in sheet_text